@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Throughput of :class:`pymoney.accumulator.Accumulator` with 1 to N threads
+compared to a :class:`Money` total guarded by a global lock.
+
+Usage: python benchmarks/bench_accumulator.py [max_threads] [adds_per_thread]
+"""
+import os
+import sys
+import threading
+from timeit import default_timer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from pymoney import Money  # noqa: E402
+from pymoney.accumulator import Accumulator  # noqa: E402
+
+
+def run(threads, adds, target):
+    workers = [threading.Thread(target=target, args=(adds,))
+               for _ in range(threads)]
+    start = default_timer()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * adds / (default_timer() - start)
+
+
+def main(max_threads=8, adds=20000):
+    value = Money('1.23', 'EUR')
+
+    accumulator = Accumulator()
+
+    def sharded(adds):
+        add = accumulator.add
+        for _ in range(adds):
+            add(value)
+
+    lock = threading.Lock()
+    total = [Money(0, 'EUR')]
+
+    def locked(adds):
+        for _ in range(adds):
+            with lock:
+                total[0] = total[0] + value
+
+    print('threads  sharded adds/s  locked adds/s')
+    for threads in range(1, max_threads + 1):
+        print('{:7d}  {:14.0f}  {:13.0f}'.format(
+            threads, run(threads, adds, sharded), run(threads, adds, locked)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
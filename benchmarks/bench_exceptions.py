@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Happy and failure path of the raising and the non raising APIs.
+
+Usage: python benchmarks/bench_exceptions.py [number]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from pymoney import Money, MoneyError  # noqa: E402
+
+
+def creation_raising(amount):
+    try:
+        return Money(amount, 'EUR')
+    except MoneyError:
+        return None
+
+
+def add_raising(a, b):
+    try:
+        return a + b
+    except MoneyError:
+        return None
+
+
+def main(number=100000):
+    eur = Money('1.23', 'EUR')
+    usd = Money('1.23', 'USD')
+    cases = [
+        ('create valid, raising', lambda: creation_raising('1.23')),
+        ('create valid, try_create', lambda: Money.try_create('1.23', 'EUR')),
+        ('create invalid, raising', lambda: creation_raising('1,23')),
+        ('create invalid, try_create',
+         lambda: Money.try_create('1,23', 'EUR')),
+        ('add same currency, raising', lambda: add_raising(eur, eur)),
+        ('add same currency, checked_add', lambda: eur.checked_add(eur)),
+        ('add mismatch, raising', lambda: add_raising(eur, usd)),
+        ('add mismatch, checked_add', lambda: eur.checked_add(usd)),
+    ]
+    for name, case in cases:
+        seconds = timeit.timeit(case, number=number)
+        print('{:32s} {:8.3f} us'.format(name, seconds / number * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
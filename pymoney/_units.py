@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Helpers for converting between :class:`Money` and integer minor units.
+
+Minor units are the amount expressed as a whole number of the smallest unit
+defined by :attr:`Money.cent_factor` (e.g. cents for the default '.01').
+Bulk code paths work on these plain integers to avoid quantizing a
+:class:`decimal.Decimal` for every intermediate value.
+"""
+import operator
+from decimal import Decimal as D
+
+from .pymoney import Money
+from .exceptions import CurrencyMismatch, UnsupportedOperatorType
+
+
+def exponent(cls=Money):
+    """Return the number of decimal places of ``cls.cent_factor``."""
+    return -D(cls.cent_factor).as_tuple().exponent
+
+
+def to_minor(money, places=None):
+    """Return the amount of `money` as an integer of minor units."""
+    if places is None:
+        places = exponent(type(money))
+    return int(money.amount.scaleb(places))
+
+
+def to_decimal(units, places=None):
+    """Return a :class:`decimal.Decimal` for the given minor `units`.
+
+    `units` may be any number, fractional values are kept exactly.
+    """
+    if places is None:
+        places = exponent()
+    return D(units).scaleb(-places)
+
+
+def from_minor(units, currency, places=None, cls=Money):
+    """Create a `cls` instance from minor `units` and `currency`."""
+    if places is None:
+        places = exponent(cls)
+    return cls(to_decimal(units, places), currency)
+
+
+def iter_minor(values, currency=None):
+    """Iterate over `values` yielding integer minor units.
+
+    `values` may contain :class:`Money` instances, which all need to share
+    the same currency, or integers (anything supporting
+    :func:`operator.index`) which are taken as minor units of `currency`.
+    The first seen currency is stored in the returned
+    :class:`MinorIterator` as :attr:`MinorIterator.currency`.
+    """
+    return MinorIterator(values, currency)
+
+
+class MinorIterator(object):
+    """Iterator returned by :func:`iter_minor`."""
+
+    def __init__(self, values, currency=None):
+        self.currency = currency
+        self._values = iter(values)
+        self._places = exponent()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        value = next(self._values)
+        if isinstance(value, Money):
+            if self.currency is None:
+                self.currency = value.currency
+            elif value.currency != self.currency:
+                raise CurrencyMismatch(
+                    'Not possible to perform operation with different '
+                    'currencies')
+            return int(value.amount.scaleb(self._places))
+        try:
+            return operator.index(value)
+        except TypeError:
+            raise UnsupportedOperatorType(
+                'Expected {} or integer minor units, got {}',
+                Money, type(value))
+
+    next = __next__
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Thread safe accumulation of :class:`Money` totals.
+
+    >>> from pymoney import Money
+    >>> from pymoney.accumulator import Accumulator
+    >>> totals = Accumulator()
+    >>> totals.add(Money('10', 'EUR'))
+    >>> totals.add_minor(550, 'EUR')
+    >>> totals.total('EUR')
+    Money(amount=Decimal('15.50'), currency='EUR')
+"""
+import operator
+import threading
+
+from . import _units
+from .pymoney import Money
+from .exceptions import UnsupportedOperatorType
+
+
+class Accumulator(object):
+    """Running totals per currency which can be updated from many threads.
+
+    Every thread adds to its own shard of integer minor units, so updates
+    never wait for a lock. A lock is only taken when a thread adds its first
+    value and by :meth:`snapshot`, which merges the shards of all threads.
+    Shards of finished threads are kept, their values are never lost.
+    Amounts are converted with the :attr:`Money.cent_factor` at the time the
+    accumulator is created.
+
+    A snapshot is exact for every update which completed before it was
+    taken, updates running concurrently with it may or may not be included.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = []
+        self._places = _units.exponent()
+
+    def add(self, money):
+        """Add `money` to the total of its currency."""
+        if not isinstance(money, Money):
+            raise UnsupportedOperatorType(
+                'Operator + is not supported for {} and {}',
+                Accumulator, type(money))
+        # Same as add_minor, inlined as this is the hot path
+        currency = money.currency
+        units = int(money.amount.scaleb(self._places))
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[currency] = shard.get(currency, 0) + units
+
+    def add_minor(self, units, currency):
+        """Add integer minor `units` to the total of `currency`.
+
+        :raises UnsupportedOperatorType: if `units` is not an integer.
+        """
+        try:
+            units = operator.index(units)
+        except TypeError:
+            raise UnsupportedOperatorType(
+                'Expected integer minor units, got {}', type(units))
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[currency] = shard.get(currency, 0) + units
+
+    def update(self, values):
+        """Add all :class:`Money` in `values`.
+
+        The values are summed locally first, so the shard is only updated
+        once per currency.
+        """
+        places = self._places
+        totals = {}
+        for money in values:
+            if not isinstance(money, Money):
+                raise UnsupportedOperatorType(
+                    'Operator + is not supported for {} and {}',
+                    Accumulator, type(money))
+            currency = money.currency
+            totals[currency] = totals.get(currency, 0) + _units.to_minor(
+                money, places)
+        for currency, units in totals.items():
+            self.add_minor(units, currency)
+
+    def snapshot(self):
+        """Return a dict mapping each currency to its total :class:`Money`."""
+        with self._lock:
+            shards = [dict(shard) for shard in self._shards]
+        totals = {}
+        for shard in shards:
+            for currency, units in shard.items():
+                totals[currency] = totals.get(currency, 0) + units
+        return dict((currency, _units.from_minor(units, currency))
+                    for currency, units in totals.items())
+
+    def total(self, currency):
+        """Return the total of `currency` as :class:`Money`."""
+        return self.snapshot().get(currency, Money(0, currency))
+
+    def _new_shard(self):
+        shard = {}
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
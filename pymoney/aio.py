@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""asyncio adapters for ingesting and totalling :class:`Money`.
+
+Messages are either :class:`Money` instances or ``(amount, currency)``
+pairs. They are collected into batches and validated per batch, large
+batches are handed to an executor so the event loop is not blocked::
+
+    aggregator = Aggregator()
+    await aggregator.consume_queue(queue, size=1000)
+    aggregator.totals()
+
+Requires Python 3.6 or newer.
+"""
+import asyncio
+from decimal import Decimal as D
+
+from . import _units
+from .pymoney import Money, parse_decimal, _current_non_trapping
+
+
+async def money_batches(source, size):
+    """Collect the messages of the async iterable `source` into lists.
+
+    Every yielded batch has `size` messages except for the last one, which
+    holds the remaining messages.
+    """
+    if size < 1:
+        raise ValueError('Batch size must be at least 1')
+    batch = []
+    async for message in source:
+        batch.append(message)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def iterate_queue(queue, sentinel=None):
+    """Yield the items of an :class:`asyncio.Queue` until `sentinel`.
+
+    Only the `sentinel` is marked as done, the consumer has to call
+    :meth:`asyncio.Queue.task_done` for every yielded item once it has been
+    processed, as :meth:`Aggregator.consume_queue` does.
+    """
+    while True:
+        item = await queue.get()
+        if item is sentinel:
+            queue.task_done()
+            return
+        yield item
+
+
+async def read_messages(reader, separator=None):
+    """Yield ``(amount, currency)`` pairs read from the lines of `reader`.
+
+    `reader` is an :class:`asyncio.StreamReader`, every line holds an amount
+    and a currency, e.g. ``b'12.50 EUR'``.
+    Lines which can not be split are yielded as is and rejected later on.
+    """
+    async for line in reader:
+        line = line.strip()
+        if not line:
+            continue
+        parts = line.decode('ascii', 'replace').split(separator)
+        yield tuple(parts) if len(parts) == 2 else line
+
+
+def parse_batch(messages):
+    """Validate `messages` and sum their amounts per currency.
+
+    Invalid amounts are detected with :func:`pymoney.pymoney.parse_decimal`
+    and a non trapping context, so no exception is raised for them. Amounts
+    are rounded like :class:`Money`. Messages with an invalid amount, an
+    amount too large to be rounded or a currency which is not a string are
+    rejected.
+
+    :returns: a tuple of a dict mapping currencies to integer minor units,
+    the number of accepted messages and a list of rejected messages.
+    """
+    places = _units.exponent()
+    cent = D(Money.cent_factor)
+    rounding = Money.rounding_method
+    context = _current_non_trapping()
+    totals = {}
+    rejected = []
+    for message in messages:
+        if isinstance(message, Money):
+            amount = message.amount
+            currency = message.currency
+        elif isinstance(message, tuple) and len(message) == 2:
+            amount, currency = message
+            amount = parse_decimal(amount)
+            if amount is not None:
+                amount = amount.quantize(cent, rounding=rounding,
+                                         context=context)
+        else:
+            amount = currency = None
+        if amount is None or amount.is_nan() or not isinstance(
+                currency, str):
+            rejected.append(message)
+            continue
+        totals[currency] = totals.get(currency, 0) + int(
+            amount.scaleb(places))
+    return totals, len(messages) - len(rejected), rejected
+
+
+class Aggregator(object):
+    """Totals per currency of the messages of async sources.
+
+    Batches with at least `executor_threshold` messages are parsed in
+    `executor` (the default executor of the loop if ``None``), smaller
+    batches directly in the event loop. At most `max_pending` batches are
+    parsed at the same time, further batches wait before the source is read
+    again, which applies backpressure to the source.
+
+    A batch is added to the totals in one step once parsed, so the totals
+    are consistent at any time. When :meth:`consume` is cancelled or fails
+    the totals hold all batches which were completely parsed, all other
+    messages read from the source are kept in :attr:`unprocessed`.
+    """
+
+    def __init__(self, executor=None, executor_threshold=1024,
+                 max_pending=4):
+        self.executor = executor
+        self.executor_threshold = executor_threshold
+        self.max_pending = max_pending
+        self.count = 0
+        self.rejected = []
+        self.unprocessed = []
+        self._totals = {}
+
+    async def add_batch(self, batch, done=None):
+        """Parse `batch` and add it to the totals.
+
+        :param done: optional callable, called with `batch` right after it
+        has been added.
+        """
+        if len(batch) >= self.executor_threshold:
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                self.executor, parse_batch, batch)
+        else:
+            result = parse_batch(batch)
+        self._merge(*result)
+        if done is not None:
+            done(batch)
+
+    async def consume(self, source, size=1024, done=None):
+        """Add all messages of the async iterable `source` in batches.
+
+        :param int size: number of messages per batch.
+        :param done: see :meth:`add_batch`.
+        :returns: the number of accepted messages of `source`.
+        """
+        if size < 1:
+            raise ValueError('Batch size must be at least 1')
+        count = self.count
+        batch = []
+        pending = {}
+        try:
+            async for message in source:
+                batch.append(message)
+                if len(batch) >= size:
+                    await self._submit(batch, pending, done)
+                    batch = []
+            if batch:
+                await self._submit(batch, pending, done)
+                batch = []
+            while pending:
+                await self._wait(pending, asyncio.ALL_COMPLETED)
+        finally:
+            for task, unprocessed in pending.items():
+                if not task.done() or task.cancelled() or (
+                        task.exception() is not None):
+                    task.cancel()
+                    self.unprocessed.extend(unprocessed)
+            self.unprocessed.extend(batch)
+        return self.count - count
+
+    async def consume_queue(self, queue, size=1024, sentinel=None):
+        """Add all messages of an :class:`asyncio.Queue` until `sentinel`.
+
+        Messages are only marked as done once they have been added to the
+        totals, so :meth:`asyncio.Queue.join` returns when the totals
+        include every message put into the queue.
+
+        :returns: the number of accepted messages.
+        """
+        def done(batch):
+            for _ in batch:
+                queue.task_done()
+        return await self.consume(iterate_queue(queue, sentinel), size, done)
+
+    def totals(self):
+        """Return a dict mapping each currency to its total :class:`Money`."""
+        return dict((currency, _units.from_minor(units, currency))
+                    for currency, units in self._totals.items())
+
+    async def _submit(self, batch, pending, done):
+        if len(pending) >= self.max_pending:
+            await self._wait(pending, asyncio.FIRST_COMPLETED)
+        pending[asyncio.ensure_future(self.add_batch(batch, done))] = batch
+
+    async def _wait(self, pending, return_when):
+        finished = (await asyncio.wait(pending, return_when=return_when))[0]
+        for task in finished:
+            task.result()
+            del pending[task]
+
+    def _merge(self, totals, count, rejected):
+        for currency, units in totals.items():
+            self._totals[currency] = self._totals.get(currency, 0) + units
+        self.count += count
+        self.rejected.extend(rejected)
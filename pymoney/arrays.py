@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Conversion between :class:`Money` and NumPy arrays.
+
+Amounts are stored as ``int64`` minor units, so no precision is lost as it
+would be with floats. NumPy is an optional dependency and only imported
+when one of the functions is called.
+
+    >>> from pymoney import Money
+    >>> from pymoney.arrays import to_numpy, from_numpy
+    >>> units, currencies = to_numpy([Money('1.50', 'EUR'),
+    ...                               Money('2', 'USD')])
+    >>> units
+    array([150, 200])
+    >>> list(from_numpy(units, currencies))[0]
+    Money(amount=Decimal('1.50'), currency='EUR')
+"""
+from decimal import Decimal as D
+
+from . import _units
+from .pymoney import Money
+from .exceptions import InvalidAmount, UnsupportedOperatorType
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('NumPy is required for pymoney.arrays')
+    return numpy
+
+
+def to_numpy(moneys, structured=False):
+    """Convert an iterable of :class:`Money` into NumPy arrays.
+
+    :param bool structured: return a single structured array with the
+    fields ``amount`` and ``currency`` instead of two arrays.
+    :returns: a tuple of an ``int64`` array of minor units and an array of
+    currency codes, or a structured array.
+    :raises UnsupportedOperatorType: if a currency is not a string.
+    :raises InvalidAmount: if an amount does not fit into ``int64``.
+    """
+    np = _numpy()
+    places = _units.exponent()
+    units = []
+    currencies = []
+    for money in moneys:
+        if not isinstance(money, Money):
+            raise UnsupportedOperatorType(
+                'Expected {}, got {}', Money, type(money))
+        if not isinstance(money.currency, str):
+            raise UnsupportedOperatorType(
+                'Currency must be {}, got {}', str, type(money.currency))
+        unit = int(money.amount.scaleb(places))
+        if not _INT64_MIN <= unit <= _INT64_MAX:
+            raise InvalidAmount(
+                'Not possible to store amount {} as int64 minor units',
+                money.amount)
+        units.append(unit)
+        currencies.append(money.currency)
+    amounts = np.array(units, dtype=np.int64)
+    codes = np.array(currencies, dtype=str)
+    if not structured:
+        return amounts, codes
+    result = np.empty(len(units), dtype=[('amount', np.int64),
+                                         ('currency', codes.dtype)])
+    result['amount'] = amounts
+    result['currency'] = codes
+    return result
+
+
+def from_numpy(units, currency=None, exponent=None, cls=Money):
+    """Lazily create :class:`Money` from NumPy arrays.
+
+    The arrays are validated once, the instances are only created while
+    iterating over the result.
+
+    :param units: integer array of minor units or a structured array as
+    returned by :func:`to_numpy`.
+    :param currency: a currency code for all values or an array of currency
+    code strings, taken from `units` if it is a structured array.
+    :param int exponent: number of decimal places of `units`, must match
+    the :attr:`Money.cent_factor` of `cls` if given.
+    :returns: an iterator of `cls` instances.
+    """
+    np = _numpy()
+    units = np.asarray(units)
+    if units.dtype.names is not None:
+        if currency is None:
+            currency = units['currency']
+        units = units['amount']
+    if units.ndim != 1:
+        raise ValueError('Units must be a one dimensional array')
+    if units.dtype.kind not in 'iu':
+        raise UnsupportedOperatorType(
+            'Expected integer minor units, got {}', units.dtype)
+    places = _units.exponent(cls)
+    if exponent is not None and exponent != places:
+        raise InvalidAmount(
+            'Not possible to create {} with {} decimal places, expected {}',
+            cls.__name__, exponent, places)
+    if currency is None:
+        raise ValueError('A currency is required')
+    if isinstance(currency, str):
+        currencies = None
+    else:
+        currencies = np.asarray(currency)
+        if currencies.dtype.kind != 'U':
+            raise UnsupportedOperatorType(
+                'Currencies must be an array of {}, got {}',
+                str, currencies.dtype)
+        if currencies.shape != units.shape:
+            raise ValueError('Currencies must have the same shape as units')
+        currencies = currencies.tolist()
+    return _iter_money(units.tolist(), currency, currencies, places, cls)
+
+
+def _iter_money(units, currency, currencies, places, cls):
+    for index, unit in enumerate(units):
+        money = cls.__new__(cls)
+        money.amount = D(unit).scaleb(-places)
+        money.currency = currency if currencies is None else (
+            currencies[index])
+        yield money
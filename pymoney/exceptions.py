@@ -2,7 +2,22 @@
 
 
 class MoneyError(Exception):
-    """Generic Money error"""
+    """Generic Money error
+
+    If more than one argument is given, the first one is a format string
+    for the others. The message is only formatted when the error is
+    converted to a string, so creating errors which are handled without
+    ever being shown stays cheap. If the arguments do not fit the format
+    string, the default message of :class:`Exception` is used.
+    """
+
+    def __str__(self):
+        if len(self.args) > 1 and isinstance(self.args[0], str):
+            try:
+                return self.args[0].format(*self.args[1:])
+            except (IndexError, KeyError, ValueError):
+                pass
+        return super(MoneyError, self).__str__()
 
 
 class InvalidAmount(MoneyError, ValueError):
@@ -16,3 +31,7 @@ class CurrencyMismatch(MoneyError, ValueError):
 
 class UnsupportedOperatorType(MoneyError, TypeError):
     """Raised when a operation is performed with an unsupported type."""
+
+
+class InsufficientData(MoneyError, ValueError):
+    """Raised when there are not enough values to compute a statistic."""
@@ -8,6 +8,58 @@ from .exceptions import (
     UnsupportedOperatorType,
 )
 
+_DIFFERENT_CURRENCIES = (
+    'Not possible to perform operation with different currencies')
+_UNSUPPORTED_TYPE = 'Operator {} is not supported for {} and {}'
+_AMOUNT_TYPES = (D, int, float, str)
+# Converting into a Decimal is exact regardless of the precision, invalid
+# amounts result in NaN instead of raising.
+_NON_TRAPPING = decimal.Context(traps=[])
+_NON_TRAPPING_CONTEXTS = {}
+
+
+def _current_non_trapping():
+    """Return a context like the current one but without any traps.
+
+    Arithmetic in it behaves as in the current context, except that results
+    which would raise are NaN.
+    """
+    context = decimal.getcontext()
+    key = (context.prec, context.rounding, context.Emin, context.Emax)
+    non_trapping = _NON_TRAPPING_CONTEXTS.get(key)
+    if non_trapping is None:
+        non_trapping = _NON_TRAPPING_CONTEXTS[key] = decimal.Context(
+            prec=context.prec, rounding=context.rounding,
+            Emin=context.Emin, Emax=context.Emax, traps=[])
+    return non_trapping
+
+
+def parse_decimal(amount):
+    """Convert `amount` into a :class:`decimal.Decimal` without raising.
+
+    :returns: the finite decimal value of `amount` or ``None`` if `amount`
+    is not a valid number.
+    """
+    if isinstance(amount, _AMOUNT_TYPES):
+        amount = D(amount, _NON_TRAPPING)
+    else:
+        try:
+            amount = D(amount)
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+    if not amount.is_finite():
+        return None
+    return amount
+
+
+def can_combine(a, b):
+    """Return whether `a` and `b` can be added, subtracted or compared.
+
+    That is the case if both are :class:`Money` with the same currency.
+    """
+    return (isinstance(a, Money) and isinstance(b, Money) and
+            a.currency == b.currency)
+
 
 class Money(object):
     """Representation of a monetary value. Money consists of an decimal amount
@@ -40,13 +92,47 @@ class Money(object):
             amount = D(amount)
         except decimal.InvalidOperation:
             raise InvalidAmount(
-                'Not possible to create {} with amount {}'.format(
-                    self.__class__.__name__, amount))
+                'Not possible to create {} with amount {}',
+                self.__class__.__name__, amount)
 
         self.amount = D(amount.quantize(D(self.cent_factor),
                                         rounding=self.rounding_method))
         self.currency = currency
 
+    @classmethod
+    def try_create(cls, amount, currency, default=None):
+        """Create an instance like the constructor but without raising.
+
+        The amount is rounded with the precision of the current decimal
+        context, as in the constructor.
+
+        :returns: the new instance or `default` if `amount` is invalid or
+        can not be rounded.
+        """
+        if isinstance(amount, _AMOUNT_TYPES):
+            amount = D(amount, _NON_TRAPPING)
+            if not amount.is_finite():
+                return default
+        else:
+            amount = parse_decimal(amount)
+            if amount is None:
+                return default
+        money = cls._from_decimal(amount, currency)
+        return default if money is None else money
+
+    @classmethod
+    def _from_decimal(cls, amount, currency):
+        # Amounts too large for the cent factor result in NaN
+        amount = amount.quantize(D(cls.cent_factor),
+                                 rounding=cls.rounding_method,
+                                 context=_current_non_trapping())
+        if amount.is_nan():
+            return None
+        money = cls.__new__(cls)
+        money.amount = amount
+        money.currency = currency
+        return money
+
     def __repr__(self):
         return '{}(amount={!r}, currency={!r})'.format(
             self.__class__.__name__,
@@ -101,12 +187,14 @@ class Money(object):
 
     def __mul__(self, other):
         if not isinstance(other, D):
-            raise UnsupportedOperatorType(other, '*')
+            raise UnsupportedOperatorType(
+                _UNSUPPORTED_TYPE, '*', type(self), type(other))
         return Money(self.amount * other, self.currency)
 
     def __rmul__(self, other):
         if not isinstance(other, D):
-            raise UnsupportedOperatorType(other, '*')
+            raise UnsupportedOperatorType(
+                _UNSUPPORTED_TYPE, '*', type(self), type(other))
         return self * other
 
     def __truediv__(self, other):
@@ -121,14 +209,74 @@ class Money(object):
 
     __div__ = __truediv__
 
+    def checked_add(self, other):
+        """Add `other` without raising.
+
+        :returns: a tuple of the result and ``None`` or of ``None`` and the
+        error which :meth:`__add__` would raise. A result which can not be
+        represented returns an :class:`InvalidAmount` error.
+        """
+        error = self._operand_error(other, '+')
+        if error is not None:
+            return None, error
+        return self._checked_result(
+            _current_non_trapping().add(self.amount, other.amount))
+
+    def checked_sub(self, other):
+        """Subtract `other` without raising, see :meth:`checked_add`."""
+        error = self._operand_error(other, '-')
+        if error is not None:
+            return None, error
+        return self._checked_result(
+            _current_non_trapping().subtract(self.amount, other.amount))
+
+    def checked_mul(self, other):
+        """Multiply with `other` without raising, see :meth:`checked_add`."""
+        if not isinstance(other, D):
+            return None, UnsupportedOperatorType(
+                _UNSUPPORTED_TYPE, '*', type(self), type(other))
+        return self._checked_result(
+            _current_non_trapping().multiply(self.amount, other))
+
+    def checked_truediv(self, other):
+        """Divide by `other` without raising, see :meth:`checked_add`."""
+        if isinstance(other, Money):
+            if self.currency != other.currency:
+                return None, CurrencyMismatch(_DIFFERENT_CURRENCIES)
+            if other.amount == D('0'):
+                return None, ZeroDivisionError()
+            return _current_non_trapping().divide(
+                self.amount, other.amount), None
+        elif not isinstance(other, (D, int)):
+            return None, UnsupportedOperatorType(
+                _UNSUPPORTED_TYPE, '/', type(self), type(other))
+        elif not other:
+            # Truth testing does not signal for NaN, unlike comparisons
+            return None, ZeroDivisionError()
+        return self._checked_result(
+            _current_non_trapping().divide(self.amount, other))
+
+    def _checked_result(self, amount):
+        money = Money._from_decimal(amount, self.currency)
+        if money is None:
+            return None, InvalidAmount(
+                'Not possible to create {} with amount {}',
+                Money.__name__, amount)
+        return money, None
+
+    def _operand_error(self, other, operator):
+        if not isinstance(other, type(self)):
+            return UnsupportedOperatorType(
+                _UNSUPPORTED_TYPE, operator, type(self), type(other))
+        if self.currency != other.currency:
+            return CurrencyMismatch(_DIFFERENT_CURRENCIES)
+        return None
+
     def _raise_for_different_currency(self, other):
         if self.currency != other.currency:
-            raise CurrencyMismatch(
-                'Not possible to perform operation with different currencies')
+            raise CurrencyMismatch(_DIFFERENT_CURRENCIES)
 
     def _raise_for_unsupported_type(self, other, operator):
         if not isinstance(other, type(self)):
             raise UnsupportedOperatorType(
-                'Operator {} is not supported for {} and {}'.format(
-                    operator, type(self), type(other))
-                )
+                _UNSUPPORTED_TYPE, operator, type(self), type(other))
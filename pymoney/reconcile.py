@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""Reconciliation of two ledgers of :class:`Money`.
+
+Entries are :class:`Money` instances or ``(money, reference)`` pairs.
+Exact matches are found while streaming the inputs with hash indexes keyed
+by currency and minor units, so memory only grows with the entries which
+are not matched yet. The remainder is then matched within a tolerance with
+sorted windows and finally one entry is matched against several entries
+sharing its reference, e.g. a payment split over several statement lines.
+
+    >>> from decimal import Decimal as D
+    >>> from pymoney import Money
+    >>> from pymoney.reconcile import reconcile
+    >>> result = reconcile([Money('10', 'EUR'), Money('5', 'EUR')],
+    ...                    [Money('5.01', 'EUR'), Money('10', 'EUR')],
+    ...                    tolerance=D('0.01'))
+    >>> len(result.matched), result.unmatched_left, result.unmatched_right
+    (2, [], [])
+"""
+from bisect import bisect_left
+from collections import namedtuple
+from decimal import Decimal as D
+
+from . import _units
+from .pymoney import Money
+from .exceptions import UnsupportedOperatorType
+
+try:
+    from itertools import zip_longest
+except ImportError:  # Python 2
+    from itertools import izip_longest as zip_longest
+
+
+class Reconciliation(namedtuple(
+        'Reconciliation', 'matched partial unmatched_left unmatched_right')):
+    """Result of a reconciliation.
+
+    :matched: list of ``(left, right)`` entry pairs.
+    :partial: list of ``(left, [right, ...])`` or ``([left, ...], right)``
+        pairs, where one entry is split over several entries.
+    :unmatched_left: list of left entries without a match.
+    :unmatched_right: list of right entries without a match.
+    """
+    __slots__ = ()
+
+
+_MISSING = object()
+
+
+def _split_entry(entry):
+    if isinstance(entry, Money):
+        return entry, None
+    if isinstance(entry, tuple) and len(entry) == 2 and isinstance(
+            entry[0], Money):
+        return entry
+    raise UnsupportedOperatorType(
+        'Expected {} or a (money, reference) pair, got {}',
+        Money, type(entry))
+
+
+def _tolerance_units(tolerance):
+    if tolerance is None:
+        return 0
+    if isinstance(tolerance, Money):
+        tolerance = tolerance.amount
+    if not isinstance(tolerance, (D, int)):
+        raise UnsupportedOperatorType(
+            'Tolerance must be {} or {}, got {}', D, Money, type(tolerance))
+    return int(D(tolerance).scaleb(_units.exponent()))
+
+
+class Reconciler(object):
+    """Incremental matching of left and right ledger entries.
+
+    Entries are fed with :meth:`add_left` and :meth:`add_right` (or
+    :meth:`stream`), exact matches are returned immediately. :meth:`finish`
+    matches the remainder within the tolerance and by reference.
+
+    :param tolerance: maximal absolute difference of the amounts of matches
+    found by :meth:`finish`.
+    :type tolerance: decimal.Decimal or :class:`Money`
+    :param bool references: whether the references of two entries have to
+    be equal for them to match.
+    """
+
+    def __init__(self, tolerance=None, references=False):
+        self.tolerance = _tolerance_units(tolerance)
+        self.references = references
+        self._places = _units.exponent()
+        self._left = {}
+        self._right = {}
+
+    @property
+    def pending(self):
+        """Return the number of entries not matched yet."""
+        return sum(len(entries) for index in (self._left, self._right)
+                   for entries in index.values())
+
+    def add_left(self, entry):
+        """Add a left `entry`.
+
+        :returns: the ``(left, right)`` pair if there was an exact match,
+        else ``None``.
+        """
+        right = self._add(entry, self._left, self._right)
+        return None if right is None else (entry, right)
+
+    def add_right(self, entry):
+        """Add a right `entry`, see :meth:`add_left`."""
+        left = self._add(entry, self._right, self._left)
+        return None if left is None else (left, entry)
+
+    def stream(self, left, right):
+        """Add the entries of both iterables alternately.
+
+        :returns: an iterator of the exact ``(left, right)`` matches.
+        """
+        for left_entry, right_entry in zip_longest(
+                left, right, fillvalue=_MISSING):
+            if left_entry is not _MISSING:
+                match = self.add_left(left_entry)
+                if match is not None:
+                    yield match
+            if right_entry is not _MISSING:
+                match = self.add_right(right_entry)
+                if match is not None:
+                    yield match
+
+    def finish(self):
+        """Match the remaining entries and return a :class:`Reconciliation`.
+
+        The :attr:`Reconciliation.matched` of the result only holds the
+        matches found within the tolerance, not the exact ones.
+        """
+        left = self._remainder(self._left)
+        right = self._remainder(self._right)
+        self._left = {}
+        self._right = {}
+        matched = []
+        if self.tolerance:
+            left, right = self._match_within_tolerance(left, right, matched)
+        partial = []
+        right, left = self._match_splits(left, right, partial, False)
+        left, right = self._match_splits(right, left, partial, True)
+        return Reconciliation(matched, partial,
+                              [entry for _, entry in left],
+                              [entry for _, entry in right])
+
+    def _key(self, entry):
+        money, reference = _split_entry(entry)
+        return (money.currency,
+                int(money.amount.scaleb(self._places)),
+                reference if self.references else None)
+
+    def _add(self, entry, own, other):
+        key = self._key(entry)
+        candidates = other.get(key)
+        if candidates:
+            match = candidates.pop()
+            if not candidates:
+                del other[key]
+            return match
+        own.setdefault(key, []).append(entry)
+        return None
+
+    def _remainder(self, index):
+        return [(key, entry) for key, entries in index.items()
+                for entry in entries]
+
+    def _match_within_tolerance(self, left, right, matched):
+        windows = {}
+        for (currency, units, reference), entry in sorted(
+                right, key=lambda item: item[0][1]):
+            window = windows.get((currency, reference))
+            if window is None:
+                window = windows[(currency, reference)] = _Window()
+            window.append(units, entry)
+        unmatched = []
+        for key, entry in sorted(left, key=lambda item: item[0][1]):
+            currency, units, reference = key
+            window = windows.get((currency, reference))
+            index = None if window is None else window.closest(
+                units, self.tolerance)
+            if index is None:
+                unmatched.append((key, entry))
+                continue
+            matched.append((entry, window.take(index)))
+        remaining = [((currency, units, reference), entry)
+                     for (currency, reference), window in windows.items()
+                     for units, entry in window.remaining()]
+        return unmatched, remaining
+
+    def _match_splits(self, single, parts, partial, swapped):
+        groups = {}
+        for key, entry in parts:
+            group = self._group(entry)
+            if group is not None:
+                groups.setdefault(group, []).append((key, entry))
+        matched = set()
+        unmatched = []
+        for key, entry in single:
+            group = self._group(entry)
+            candidates = groups.get(group)
+            if (group is None or group in matched or not candidates or
+                    len(candidates) < 2 or abs(sum(
+                        part_key[1] for part_key, _ in candidates) -
+                        key[1]) > self.tolerance):
+                unmatched.append((key, entry))
+                continue
+            matched.add(group)
+            entries = [part for _, part in candidates]
+            partial.append((entries, entry) if swapped else (entry, entries))
+        remaining = [(key, entry) for key, entry in parts
+                     if self._group(entry) not in matched]
+        return remaining, unmatched
+
+    def _group(self, entry):
+        money, reference = _split_entry(entry)
+        return None if reference is None else (money.currency, reference)
+
+
+def reconcile(left, right, tolerance=None, references=False):
+    """Match the entries of the `left` and `right` ledgers.
+
+    Both iterables are consumed alternately, see :class:`Reconciler` for
+    the parameters.
+
+    :returns: a :class:`Reconciliation` holding the exact matches as well
+    as those within `tolerance`.
+    """
+    reconciler = Reconciler(tolerance, references)
+    matched = list(reconciler.stream(left, right))
+    result = reconciler.finish()
+    return result._replace(matched=matched + result.matched)
+
+
+def _find(parents, index):
+    root = index
+    while parents[root] != root:
+        root = parents[root]
+    while parents[index] != root:
+        parents[index], index = root, parents[index]
+    return root
+
+
+class _Window(object):
+    """Sorted entries of which the closest one to an amount can be taken.
+
+    Taken entries are only marked, the next and previous entry which is not
+    taken yet are found with path compressed pointers, so taking entries
+    does not shift the lists.
+    """
+
+    def __init__(self):
+        self.units = []
+        self.entries = []
+        self._next = None
+        self._previous = None
+
+    def append(self, units, entry):
+        self.units.append(units)
+        self.entries.append(entry)
+
+    def closest(self, units, tolerance):
+        """Return the index of the closest entry not taken or ``None``."""
+        if self._next is None:
+            # _next[i] leads to the first index >= i not taken, len(units)
+            # if there is none. _previous[i + 1] leads to the last index
+            # <= i not taken plus one, 0 if there is none.
+            self._next = list(range(len(self.units) + 1))
+            self._previous = list(range(len(self.units) + 1))
+        position = bisect_left(self.units, units)
+        best = None
+        for index in (_find(self._previous, position) - 1,
+                      _find(self._next, position)):
+            if 0 <= index < len(self.units):
+                difference = abs(self.units[index] - units)
+                if difference <= tolerance and (
+                        best is None or difference < best[0]):
+                    best = (difference, index)
+        return None if best is None else best[1]
+
+    def take(self, index):
+        """Mark the entry at `index` as taken and return it."""
+        self._next[index] = index + 1
+        self._previous[index + 1] = index
+        return self.entries[index]
+
+    def remaining(self):
+        """Return a list of the ``(units, entry)`` pairs not taken."""
+        if self._next is None:
+            return list(zip(self.units, self.entries))
+        return [(self.units[index], self.entries[index])
+                for index in range(len(self.units))
+                if self._next[index] == index]
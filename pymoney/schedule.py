@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Lazy amortization and interest schedules.
+
+The generators carry the running balance as integer minor units and round
+each row exactly once with :attr:`Money.rounding_method`. Any residual
+from rounding is absorbed by the final row, so the rows always add up to
+the principal.
+
+    >>> from decimal import Decimal as D
+    >>> from pymoney import Money
+    >>> from pymoney.schedule import amortize
+    >>> rows = list(amortize(Money('1000', 'EUR'), D('0.01'), 3))
+    >>> rows[0].payment
+    Money(amount=Decimal('340.02'), currency='EUR')
+    >>> rows[-1].balance
+    Money(amount=Decimal('0.00'), currency='EUR')
+"""
+import decimal
+from collections import namedtuple
+from decimal import Decimal as D
+
+from . import _units
+from .pymoney import Money
+from .exceptions import UnsupportedOperatorType
+
+#: Precision used for intermediate results such as annuity factors.
+PRECISION = 34
+
+
+class AmortizationRow(namedtuple(
+        'AmortizationRow', 'period payment interest principal balance')):
+    """A period of an amortization schedule."""
+    __slots__ = ()
+
+
+class CompoundRow(namedtuple('CompoundRow', 'period interest balance')):
+    """A period of a compound interest schedule."""
+    __slots__ = ()
+
+
+def _check_terms(rate, periods):
+    if not isinstance(rate, D):
+        raise UnsupportedOperatorType(
+            'Rate must be {}, got {}'.format(D, type(rate)))
+    if periods < 1:
+        raise ValueError('At least one period is required')
+
+
+def _round(value):
+    return int(value.to_integral_value(rounding=Money.rounding_method))
+
+
+class AnnuityTerms(object):
+    """Terms of an annuity loan shared by any number of contracts.
+
+    The annuity factor is computed once, so schedules of many contracts with
+    the same terms only need one multiplication per contract for the
+    payment.
+
+    :param rate: interest rate per period.
+    :type rate: decimal.Decimal
+    :param int periods: number of periods.
+    """
+
+    def __init__(self, rate, periods):
+        _check_terms(rate, periods)
+        self.rate = rate
+        self.periods = periods
+        with decimal.localcontext() as ctx:
+            ctx.prec = PRECISION
+            if rate:
+                self.factor = rate / (1 - (1 + rate) ** -periods)
+            else:
+                self.factor = D(1) / periods
+
+    def payment(self, principal):
+        """Return the rounded payment per period for `principal`."""
+        units = self._payment_units(_units.to_minor(principal))
+        return _units.from_minor(units, principal.currency)
+
+    def schedule(self, principal):
+        """Yield the :class:`AmortizationRow` of each period lazily.
+
+        :param principal: the loan amount.
+        :type principal: :class:`Money`
+        """
+        currency = principal.currency
+        places = _units.exponent()
+        rate = self.rate
+        balance = _units.to_minor(principal, places)
+        payment = self._payment_units(balance)
+        for period in range(1, self.periods + 1):
+            with decimal.localcontext() as ctx:
+                ctx.prec = PRECISION
+                interest = _round(balance * rate)
+            if period == self.periods:
+                paid = balance
+            else:
+                # A rounded payment may exceed what is still owed
+                paid = min(payment - interest, balance)
+            balance -= paid
+            yield AmortizationRow(
+                period,
+                _units.from_minor(paid + interest, currency, places),
+                _units.from_minor(interest, currency, places),
+                _units.from_minor(paid, currency, places),
+                _units.from_minor(balance, currency, places))
+
+    def _payment_units(self, units):
+        with decimal.localcontext() as ctx:
+            ctx.prec = PRECISION
+            return _round(units * self.factor)
+
+
+def amortize(principal, rate, periods):
+    """Yield the rows of an annuity loan amortization schedule.
+
+    Every period has the same payment, except for the last one which pays
+    off the remaining balance including any rounding residual. A payment is
+    never more than the balance plus interest, so the balance does not drop
+    below zero before the last period.
+
+    :param principal: the loan amount.
+    :type principal: :class:`Money`
+    :param rate: interest rate per period.
+    :type rate: decimal.Decimal
+    :param int periods: number of periods.
+    """
+    return AnnuityTerms(rate, periods).schedule(principal)
+
+
+def amortize_batch(principals, rate, periods):
+    """Yield an amortization schedule for each of `principals`.
+
+    All contracts share `rate` and `periods`, so the annuity factor is only
+    computed once. Each schedule is a lazy generator as returned by
+    :func:`amortize`.
+    """
+    terms = AnnuityTerms(rate, periods)
+    for principal in principals:
+        yield terms.schedule(principal)
+
+
+def compound(principal, rate, periods):
+    """Yield the rows of compounding `principal` with `rate` per period.
+
+    The balance is computed with full precision and only rounded for the
+    row, the interest of a row is the difference between two rounded
+    balances so the interests add up to the final balance.
+
+    :param principal: the initial amount.
+    :type principal: :class:`Money`
+    :param rate: interest rate per period.
+    :type rate: decimal.Decimal
+    :param int periods: number of periods.
+    """
+    _check_terms(rate, periods)
+    currency = principal.currency
+    places = _units.exponent()
+    exact = D(_units.to_minor(principal, places))
+    previous = int(exact)
+    growth = 1 + rate
+    for period in range(1, periods + 1):
+        with decimal.localcontext() as ctx:
+            ctx.prec = PRECISION
+            exact *= growth
+        balance = _round(exact)
+        yield CompoundRow(
+            period,
+            _units.from_minor(balance - previous, currency, places),
+            _units.from_minor(balance, currency, places))
+        previous = balance
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""Statistics over streams of :class:`Money`.
+
+All functions accept iterables of :class:`Money` with a common currency or
+iterables of integer minor units (e.g. an :class:`array.array`) together
+with a `currency`, without one a :class:`ValueError` is raised. Values are
+consumed in a single pass and results are returned as :class:`Money` in the
+currency of the input.
+
+    >>> from pymoney import Money
+    >>> from pymoney import stats
+    >>> stats.mean([Money('10', 'EUR'), Money('20', 'EUR')])
+    Money(amount=Decimal('15.00'), currency='EUR')
+    >>> stats.percentile([1000, 2000, 3000], 50, currency='EUR')
+    Money(amount=Decimal('20.00'), currency='EUR')
+"""
+import math
+from decimal import Decimal as D
+
+from . import _units
+from .exceptions import CurrencyMismatch, InsufficientData
+
+
+def _check_currency(first, second):
+    if None not in (first, second) and first != second:
+        raise CurrencyMismatch(
+            'Not possible to perform operation with different currencies')
+
+
+def _money(units, currency):
+    if currency is None:
+        raise ValueError(
+            'A currency is required for values given as minor units')
+    return _units.from_minor(units, currency)
+
+
+def _check_quantile(q):
+    if not 0 <= q <= 100:
+        raise ValueError('Percentile must be between 0 and 100')
+
+
+class RunningStats(object):
+    """Exact single pass mean and variance.
+
+    Count, sum and sum of squares are kept as integers of minor units, so no
+    precision is lost regardless of the stream length and partial results
+    of several workers can be combined with :meth:`merge`.
+
+    :param str currency: currency of the values, detected from the first
+    :class:`Money` if not given.
+    """
+
+    def __init__(self, currency=None):
+        self.currency = currency
+        self.count = 0
+        self._sum = 0
+        self._sum_squares = 0
+
+    def update(self, values):
+        """Add all `values` and return `self`."""
+        count = 0
+        total = 0
+        squares = 0
+        units = _units.iter_minor(values, self.currency)
+        for unit in units:
+            count += 1
+            total += unit
+            squares += unit * unit
+        self.currency = units.currency
+        self.count += count
+        self._sum += total
+        self._sum_squares += squares
+        return self
+
+    def add(self, value):
+        """Add a single `value` and return `self`."""
+        return self.update((value,))
+
+    def merge(self, other):
+        """Combine the values of `other` into `self` and return `self`."""
+        _check_currency(self.currency, other.currency)
+        if self.currency is None:
+            self.currency = other.currency
+        self.count += other.count
+        self._sum += other._sum
+        self._sum_squares += other._sum_squares
+        return self
+
+    def total(self):
+        """Return the sum of all values as :class:`Money`."""
+        return _money(self._sum, self.currency)
+
+    def mean(self):
+        """Return the arithmetic mean as :class:`Money`."""
+        self._require(1)
+        return _money(D(self._sum) / self.count, self.currency)
+
+    def variance(self, sample=True):
+        """Return the variance as :class:`decimal.Decimal`.
+
+        The variance is expressed in squared major units and is not rounded,
+        as it is not a monetary value.
+
+        :param bool sample: compute the sample variance (divide by n - 1),
+        otherwise the population variance (divide by n).
+        """
+        return self._unit_variance(sample).scaleb(-2 * _units.exponent())
+
+    def stdev(self, sample=True):
+        """Return the standard deviation as :class:`Money`.
+
+        :param bool sample: see :meth:`variance`.
+        """
+        return _money(self._unit_variance(sample).sqrt(), self.currency)
+
+    def _unit_variance(self, sample):
+        ddof = 1 if sample else 0
+        self._require(1 + ddof)
+        numerator = self.count * self._sum_squares - self._sum * self._sum
+        return D(numerator) / (self.count * (self.count - ddof))
+
+    def _require(self, count):
+        if self.count < count:
+            raise InsufficientData(
+                'At least {} values are required'.format(count))
+
+
+class QuantileSketch(object):
+    """Mergeable fixed memory quantile sketch.
+
+    Values are counted in logarithmically sized buckets of minor units, so
+    every estimated quantile is within a relative error of
+    `relative_accuracy` of an actual input value. At most `max_buckets`
+    buckets are kept per sign, when exceeded the buckets closest to zero
+    are collapsed, which only affects the accuracy of the smallest
+    amounts. Sketches with the same `relative_accuracy` can be combined
+    with :meth:`merge`, e.g. after being computed by different workers.
+
+    :param str currency: currency of the values, detected from the first
+    :class:`Money` if not given.
+    :param float relative_accuracy: maximal relative error of a quantile.
+    :param int max_buckets: maximal number of buckets per sign.
+    """
+
+    def __init__(self, currency=None, relative_accuracy=0.01,
+                 max_buckets=2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('relative_accuracy must be between 0 and 1')
+        self.currency = currency
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._zeros = 0
+        self._positive = {}
+        self._negative = {}
+
+    def update(self, values):
+        """Add all `values` and return `self`."""
+        units = _units.iter_minor(values, self.currency)
+        log_gamma = self._log_gamma
+        positive = self._positive
+        negative = self._negative
+        count = 0
+        low = self.min
+        high = self.max
+        for unit in units:
+            count += 1
+            if low is None or unit < low:
+                low = unit
+            if high is None or unit > high:
+                high = unit
+            if unit > 0:
+                key = int(math.ceil(math.log(unit) / log_gamma))
+                positive[key] = positive.get(key, 0) + 1
+            elif unit < 0:
+                key = int(math.ceil(math.log(-unit) / log_gamma))
+                negative[key] = negative.get(key, 0) + 1
+            else:
+                self._zeros += 1
+        self.currency = units.currency
+        self.count += count
+        self.min = low
+        self.max = high
+        self._collapse()
+        return self
+
+    def add(self, value):
+        """Add a single `value` and return `self`."""
+        return self.update((value,))
+
+    def merge(self, other):
+        """Combine the values of `other` into `self` and return `self`."""
+        _check_currency(self.currency, other.currency)
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                'Not possible to merge sketches with different accuracy')
+        if self.currency is None:
+            self.currency = other.currency
+        for mine, theirs in ((self._positive, other._positive),
+                             (self._negative, other._negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+        if other.count:
+            self.min = other.min if self.min is None else min(
+                self.min, other.min)
+            self.max = other.max if self.max is None else max(
+                self.max, other.max)
+        self._collapse()
+        return self
+
+    def percentile(self, q):
+        """Return the estimated `q`-th percentile as :class:`Money`.
+
+        :param q: percentile between 0 and 100.
+        """
+        _check_quantile(q)
+        if not self.count:
+            raise InsufficientData('At least 1 value is required')
+        rank = int(math.floor(float(q) / 100 * (self.count - 1)))
+        if rank == 0:
+            return _money(self.min, self.currency)
+        if rank == self.count - 1:
+            return _money(self.max, self.currency)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._bucket_value(key, -1)
+        seen += self._zeros
+        if seen > rank:
+            return _money(0, self.currency)
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._bucket_value(key, 1)
+        return _money(self.max, self.currency)
+
+    def histogram(self):
+        """Return a list of ``(lower, upper, count)`` bucket tuples.
+
+        The bounds are :class:`Money` instances, rounded to minor units, and
+        the buckets are sorted in ascending order.
+        """
+        buckets = []
+        for key in sorted(self._negative, reverse=True):
+            buckets.append((-self._gamma ** key, -self._gamma ** (key - 1),
+                            self._negative[key]))
+        if self._zeros:
+            buckets.append((0, 0, self._zeros))
+        for key in sorted(self._positive):
+            buckets.append((self._gamma ** (key - 1), self._gamma ** key,
+                            self._positive[key]))
+        return [(_money(D(lower), self.currency),
+                 _money(D(upper), self.currency),
+                 count)
+                for lower, upper, count in buckets]
+
+    def _bucket_value(self, key, sign):
+        value = 2 * self._gamma ** key / (self._gamma + 1)
+        value = min(max(sign * value, self.min), self.max)
+        return _money(D(value), self.currency)
+
+    def _collapse(self):
+        for buckets in (self._positive, self._negative):
+            if len(buckets) <= self.max_buckets:
+                continue
+            keys = sorted(buckets)
+            excess = len(keys) - self.max_buckets
+            target = keys[excess]
+            for key in keys[:excess]:
+                buckets[target] += buckets.pop(key)
+
+
+def mean(values, currency=None):
+    """Return the arithmetic mean of `values` as :class:`Money`."""
+    return RunningStats(currency).update(values).mean()
+
+
+def variance(values, currency=None, sample=True):
+    """Return the variance of `values`, see :meth:`RunningStats.variance`."""
+    return RunningStats(currency).update(values).variance(sample)
+
+
+def stdev(values, currency=None, sample=True):
+    """Return the standard deviation of `values` as :class:`Money`."""
+    return RunningStats(currency).update(values).stdev(sample)
+
+
+def percentile(values, q, currency=None):
+    """Return the exact `q`-th percentile of `values` as :class:`Money`.
+
+    All values are held in memory as integers, for large streams use a
+    :class:`QuantileSketch` instead. Values between two ranks are linearly
+    interpolated.
+
+    :param q: percentile between 0 and 100.
+    """
+    return percentiles(values, (q,), currency)[0]
+
+
+def percentiles(values, qs, currency=None):
+    """Return a list of the exact percentiles `qs` of `values`.
+
+    See :func:`percentile`, `values` are only sorted once.
+    """
+    for q in qs:
+        _check_quantile(q)
+    units = _units.iter_minor(values, currency)
+    data = sorted(units)
+    if not data:
+        raise InsufficientData('At least 1 value is required')
+    result = []
+    for q in qs:
+        position = D(q) / 100 * (len(data) - 1)
+        lower = int(position)
+        fraction = position - lower
+        value = D(data[lower])
+        if fraction:
+            value += (data[lower + 1] - value) * fraction
+        result.append(_money(value, units.currency))
+    return result
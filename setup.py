@@ -29,6 +29,9 @@ setup(
                  'pymoney'},
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        'numpy': ['numpy'],
+    },
     license="MIT license",
     zip_safe=False,
     keywords='pymoney',
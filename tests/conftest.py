@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+import sys
+
+collect_ignore = []
+if sys.version_info < (3, 6):
+    # pymoney.aio uses async generators
+    collect_ignore.append('test_aio.py')
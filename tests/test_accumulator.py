@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_accumulator
+----------------------------------
+
+Tests for `pymoney.accumulator` module.
+"""
+
+import threading
+
+import pytest
+
+from pymoney import Money, UnsupportedOperatorType
+from pymoney.accumulator import Accumulator
+
+
+def test_accumulator_add():
+    totals = Accumulator()
+    totals.add(Money('10.50', 'EUR'))
+    totals.add(Money('1.25', 'EUR'))
+    totals.add(Money('3', 'USD'))
+    assert {'EUR': Money('11.75', 'EUR'),
+            'USD': Money('3', 'USD')} == totals.snapshot()
+
+
+def test_accumulator_update():
+    totals = Accumulator()
+    totals.update([Money('1', 'EUR'), Money('2', 'USD'), Money('3', 'EUR')])
+    assert Money('4', 'EUR') == totals.total('EUR')
+    assert Money('2', 'USD') == totals.total('USD')
+
+
+def test_accumulator_total_of_unknown_currency_is_zero():
+    assert Money('0', 'EUR') == Accumulator().total('EUR')
+
+
+def test_accumulator_add_with_other_types_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        Accumulator().add(42)
+
+
+def test_accumulator_add_minor_with_non_integer_raises():
+    totals = Accumulator()
+    with pytest.raises(UnsupportedOperatorType):
+        totals.add_minor(1.5, 'EUR')
+    assert {} == totals.snapshot()
+
+
+def test_accumulator_stress_with_many_threads():
+    totals = Accumulator()
+    threads = 16
+    iterations = 2000
+    start = threading.Event()
+
+    def work(index):
+        start.wait()
+        for _ in range(iterations):
+            totals.add_minor(1, 'EUR')
+            totals.add(Money('0.02', 'USD'))
+            if index % 2:
+                totals.snapshot()
+
+    workers = [threading.Thread(target=work, args=(i,))
+               for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    start.set()
+    for worker in workers:
+        worker.join()
+
+    assert {'EUR': Money('320', 'EUR'),
+            'USD': Money('640', 'USD')} == totals.snapshot()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_aio
+----------------------------------
+
+Tests for `pymoney.aio` module.
+"""
+
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import pytest
+
+from pymoney import Money
+from pymoney.aio import (
+    Aggregator, iterate_queue, money_batches, parse_batch, read_messages,
+)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def aiter_list(items):
+    for item in items:
+        yield item
+
+
+async def collect(source):
+    return [item async for item in source]
+
+
+def test_money_batches():
+    batches = run(collect(money_batches(aiter_list(range(5)), size=2)))
+    assert [[0, 1], [2, 3], [4]] == batches
+
+
+def test_money_batches_with_invalid_size_raises():
+    with pytest.raises(ValueError):
+        run(collect(money_batches(aiter_list([]), size=0)))
+
+
+def test_iterate_queue_until_sentinel():
+    async def produce_and_collect():
+        queue = asyncio.Queue()
+        for item in ('a', 'b', None, 'c'):
+            queue.put_nowait(item)
+        items = await collect(iterate_queue(queue))
+        # Only the sentinel is marked as done, 'c' was never read
+        queue.task_done()
+        queue.task_done()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.join(), 0.01)
+        return items
+    assert ['a', 'b'] == run(produce_and_collect())
+
+
+def test_parse_batch_rejects_invalid_messages_without_raising():
+    messages = [Money('1.50', 'EUR'), ('2.505', 'EUR'), ('9,231', 'EUR'),
+                (None, 'EUR'), 'garbage', (3, 'USD'), ('NaN', 'USD'),
+                ('1e30', 'EUR'), ('1', None), ('1', 5),
+                Money('1', None)]
+    totals, count, rejected = parse_batch(messages)
+    assert {'EUR': 400, 'USD': 300} == totals
+    assert 3 == count
+    assert [('9,231', 'EUR'), (None, 'EUR'), 'garbage', ('NaN', 'USD'),
+            ('1e30', 'EUR'), ('1', None), ('1', 5),
+            Money('1', None)] == rejected
+
+
+def test_aggregator_consume_uses_executor_for_large_batches():
+    messages = [('0.01', 'EUR')] * 5000 + [('1', 'USD')]
+
+    async def consume():
+        with ThreadPoolExecutor(2) as executor:
+            aggregator = Aggregator(executor, executor_threshold=100,
+                                    max_pending=2)
+            count = await aggregator.consume(aiter_list(messages), size=300)
+        return aggregator, count
+
+    aggregator, count = run(consume())
+    assert 5001 == count
+    assert {'EUR': Money('50', 'EUR'),
+            'USD': Money('1', 'USD')} == aggregator.totals()
+
+
+def test_aggregator_consume_queue_acknowledges_after_adding():
+    async def consume():
+        queue = asyncio.Queue()
+        aggregator = Aggregator()
+        task = asyncio.ensure_future(aggregator.consume_queue(queue, size=2))
+        for _ in range(5):
+            await queue.put(('1', 'EUR'))
+        await queue.put(None)
+        await queue.join()
+        totals = aggregator.totals()
+        await task
+        return totals
+
+    assert {'EUR': Money('5', 'EUR')} == run(consume())
+
+
+def test_aggregator_keeps_unprocessed_messages_on_cancellation():
+    async def consume():
+        queue = asyncio.Queue()
+        aggregator = Aggregator()
+        task = asyncio.ensure_future(aggregator.consume_queue(queue, size=2))
+        for _ in range(5):
+            await queue.put(('1', 'EUR'))
+        while aggregator.count < 4:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The unprocessed message is not marked as done
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.join(), 0.01)
+        return aggregator
+
+    aggregator = run(consume())
+    assert {'EUR': Money('4', 'EUR')} == aggregator.totals()
+    assert 4 == aggregator.count
+    assert [('1', 'EUR')] == aggregator.unprocessed
+
+
+class BlockingExecutor(Executor):
+    def submit(self, fn, *args, **kwargs):
+        return Future()
+
+
+def test_aggregator_keeps_batches_of_cancelled_executor_tasks():
+    async def consume():
+        aggregator = Aggregator(BlockingExecutor(), executor_threshold=2)
+        task = asyncio.ensure_future(aggregator.consume(
+            aiter_list([('1', 'EUR'), ('2', 'EUR'), ('3', 'EUR')]), size=2))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return aggregator
+
+    aggregator = run(consume())
+    assert {'EUR': Money('3', 'EUR')} == aggregator.totals()
+    assert [('1', 'EUR'), ('2', 'EUR')] == aggregator.unprocessed
+
+
+def test_aggregator_reads_from_stream():
+    async def consume():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'12.50 EUR\n\n1.5 EUR\nbroken\n3 USD\n')
+        reader.feed_eof()
+        aggregator = Aggregator()
+        await aggregator.consume(read_messages(reader), size=2)
+        return aggregator
+
+    aggregator = run(consume())
+    assert {'EUR': Money('14', 'EUR'),
+            'USD': Money('3', 'USD')} == aggregator.totals()
+    assert [b'broken'] == aggregator.rejected
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_arrays
+----------------------------------
+
+Tests for `pymoney.arrays` module.
+"""
+
+import types
+
+import pytest
+from decimal import Decimal as D
+
+from pymoney import Money, InvalidAmount, UnsupportedOperatorType
+from pymoney.arrays import from_numpy, to_numpy
+
+np = pytest.importorskip('numpy')
+
+
+def test_to_numpy():
+    units, currencies = to_numpy([Money(D('1.50'), 'EUR'),
+                                  Money(D('-92233720368547758.08'), 'USD')])
+    assert np.int64 == units.dtype
+    assert [150, -9223372036854775808] == units.tolist()
+    assert ['EUR', 'USD'] == currencies.tolist()
+
+
+def test_to_numpy_with_amount_outside_int64_raises():
+    with pytest.raises(InvalidAmount):
+        to_numpy([Money(D('-92233720368547758.09'), 'EUR')])
+    with pytest.raises(InvalidAmount):
+        to_numpy([Money(D('1e20'), 'EUR')])
+
+
+def test_to_numpy_structured():
+    result = to_numpy([Money(D('1.50'), 'EUR'), Money(D('2'), 'USD')],
+                      structured=True)
+    assert ('amount', 'currency') == result.dtype.names
+    assert [150, 200] == result['amount'].tolist()
+    assert ['EUR', 'USD'] == result['currency'].tolist()
+
+
+def test_to_numpy_with_other_types_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        to_numpy([Money(D('1'), 'EUR'), D('1')])
+
+
+def test_to_numpy_with_non_string_currency_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        to_numpy([Money(D('1'), 'EUR'), Money(D('2'), None)])
+
+
+def test_from_numpy_with_non_string_currencies_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        from_numpy(np.array([1, 2]), np.array([1, 2]))
+    with pytest.raises(UnsupportedOperatorType):
+        from_numpy(np.array([1, 2]), np.array([b'EUR', b'USD']))
+
+
+def test_from_numpy_is_lazy():
+    result = from_numpy(np.array([150, 200]), 'EUR')
+    assert isinstance(result, types.GeneratorType)
+    assert [Money(D('1.50'), 'EUR'), Money(D('2'), 'EUR')] == list(result)
+
+
+def test_from_numpy_round_trip():
+    moneys = [Money(D('1.50'), 'EUR'), Money(D('-2.01'), 'USD'),
+              Money(D('0'), 'EUR')]
+    assert moneys == list(from_numpy(*to_numpy(moneys)))
+    assert moneys == list(from_numpy(to_numpy(moneys, structured=True)))
+
+
+def test_from_numpy_keeps_cent_places():
+    money = next(from_numpy(np.array([100]), 'EUR'))
+    assert "Money(amount=Decimal('1.00'), currency='EUR')" == repr(money)
+
+
+def test_from_numpy_with_float_units_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        from_numpy(np.array([1.5]), 'EUR')
+
+
+def test_from_numpy_with_different_exponent_raises():
+    with pytest.raises(InvalidAmount):
+        from_numpy(np.array([1500]), 'EUR', exponent=3)
+
+
+def test_from_numpy_with_different_shapes_raises():
+    with pytest.raises(ValueError):
+        from_numpy(np.array([1, 2]), np.array(['EUR']))
@@ -8,11 +8,14 @@ test_pymoney
 Tests for `pymoney` module.
 """
 
+import decimal
+
 import pytest
 from decimal import Decimal as D
 
-from pymoney import Money
+from pymoney import Money, can_combine
 from pymoney import (
+    MoneyError,
     InvalidAmount,
     CurrencyMismatch,
     UnsupportedOperatorType,
@@ -290,3 +293,116 @@ def test_division_by_decimal_returns_money():
 def test_division_with_different_currency_raises():
     with pytest.raises(CurrencyMismatch):
         Money(D('42'), 'EUR') / Money(D('21'), 'USD')
+
+
+def test_money_init_invalid_amount_message():
+    with pytest.raises(InvalidAmount) as excinfo:
+        Money('9,231', 'EUR')
+    assert 'Not possible to create Money with amount 9,231' == str(
+        excinfo.value)
+
+
+def test_unsupported_type_message():
+    with pytest.raises(UnsupportedOperatorType) as excinfo:
+        Money(D('42'), 'EUR') * 2
+    assert "Operator * is not supported for {} and {}".format(
+        Money, int) == str(excinfo.value)
+
+
+def test_try_create_money():
+    assert Money(D('42'), 'EUR') == Money.try_create('42', 'EUR')
+    assert Money(D('42'), 'EUR') == Money.try_create(D('42'), 'EUR')
+
+
+def test_try_create_money_with_invalid_amount():
+    assert Money.try_create('9,231', 'EUR') is None
+    assert Money.try_create(None, 'EUR') is None
+    assert Money.try_create('NaN', 'EUR') is None
+    assert 0 == Money.try_create('Infinity', 'EUR', default=0)
+
+
+def test_try_create_money_with_too_large_amount():
+    assert Money.try_create('1e30', 'EUR') is None
+    assert Money.try_create(D('1e30'), 'EUR') is None
+
+
+def test_try_create_money_uses_current_precision():
+    with decimal.localcontext() as ctx:
+        ctx.prec = 50
+        assert Money(D('1e30'), 'EUR') == Money.try_create('1e30', 'EUR')
+
+
+def test_money_error_message_with_unformattable_arguments():
+    assert str(MoneyError('a {x}', 1)) == "('a {x}', 1)"
+    assert str(MoneyError('a {}', 1)) == 'a 1'
+
+
+def test_can_combine():
+    assert can_combine(Money(D('1'), 'EUR'), Money(D('2'), 'EUR'))
+    assert not can_combine(Money(D('1'), 'EUR'), Money(D('2'), 'USD'))
+    assert not can_combine(Money(D('1'), 'EUR'), D('2'))
+
+
+def test_checked_add():
+    result, error = Money(D('21'), 'EUR').checked_add(Money(D('21'), 'EUR'))
+    assert Money(D('42'), 'EUR') == result
+    assert error is None
+
+
+def test_checked_add_with_different_currencies():
+    result, error = Money(D('21'), 'EUR').checked_add(Money(D('21'), 'USD'))
+    assert result is None
+    assert isinstance(error, CurrencyMismatch)
+
+
+def test_checked_sub_with_other_types():
+    result, error = Money(D('21'), 'EUR').checked_sub(D('21'))
+    assert result is None
+    assert isinstance(error, UnsupportedOperatorType)
+
+
+def test_checked_mul():
+    assert (Money(D('42'), 'EUR'), None) == Money(
+        D('21'), 'EUR').checked_mul(D('2'))
+    result, error = Money(D('21'), 'EUR').checked_mul(2)
+    assert isinstance(error, UnsupportedOperatorType)
+
+
+def test_checked_truediv():
+    assert (D('2'), None) == Money(D('42'), 'EUR').checked_truediv(
+        Money(D('21'), 'EUR'))
+    assert (Money(D('21'), 'EUR'), None) == Money(
+        D('42'), 'EUR').checked_truediv(D('2'))
+    result, error = Money(D('42'), 'EUR').checked_truediv(D('0'))
+    assert isinstance(error, ZeroDivisionError)
+    result, error = Money(D('42'), 'EUR').checked_truediv(
+        Money(D('21'), 'USD'))
+    assert isinstance(error, CurrencyMismatch)
+
+
+def test_checked_truediv_with_other_types():
+    result, error = Money(D('42'), 'EUR').checked_truediv('x')
+    assert result is None
+    assert isinstance(error, UnsupportedOperatorType)
+
+
+def test_checked_operations_with_too_large_results():
+    result, error = Money(D('42'), 'EUR').checked_truediv(D('1e-40'))
+    assert result is None
+    assert isinstance(error, InvalidAmount)
+    result, error = Money(D('42'), 'EUR').checked_mul(D('1e40'))
+    assert isinstance(error, InvalidAmount)
+
+
+def test_checked_operations_with_non_finite_operands():
+    result, error = Money(D('0'), 'EUR').checked_mul(D('Infinity'))
+    assert result is None
+    assert isinstance(error, InvalidAmount)
+    result, error = Money(D('1'), 'EUR').checked_mul(D('sNaN'))
+    assert isinstance(error, InvalidAmount)
+    result, error = Money(D('1'), 'EUR').checked_truediv(D('sNaN'))
+    assert isinstance(error, InvalidAmount)
+    result, error = Money(D('1'), 'EUR').checked_truediv(D('NaN'))
+    assert isinstance(error, InvalidAmount)
+    assert (Money(D('0'), 'EUR'), None) == Money(
+        D('1'), 'EUR').checked_truediv(D('Infinity'))
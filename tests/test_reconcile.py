@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_reconcile
+----------------------------------
+
+Tests for `pymoney.reconcile` module.
+"""
+
+import pytest
+from decimal import Decimal as D
+
+from pymoney import Money, UnsupportedOperatorType
+from pymoney.reconcile import Reconciler, reconcile
+
+
+def eur(amount):
+    return Money(D(amount), 'EUR')
+
+
+def test_reconcile_exact_matches():
+    left = [eur('10'), eur('20'), eur('10'), Money(D('5'), 'USD')]
+    right = [eur('10'), Money(D('5'), 'USD'), eur('10'), eur('30')]
+    result = reconcile(left, right)
+    assert sorted([(eur('10'), eur('10')), (eur('10'), eur('10')),
+                   (Money(D('5'), 'USD'), Money(D('5'), 'USD'))],
+                  key=repr) == sorted(result.matched, key=repr)
+    assert [eur('20')] == result.unmatched_left
+    assert [eur('30')] == result.unmatched_right
+    assert [] == result.partial
+
+
+def test_reconcile_does_not_match_different_currencies():
+    result = reconcile([eur('10')], [Money(D('10'), 'USD')])
+    assert [] == result.matched
+    assert [eur('10')] == result.unmatched_left
+
+
+def test_reconcile_within_tolerance_prefers_closest():
+    left = [eur('10.00'), eur('50')]
+    right = [eur('10.04'), eur('9.98'), eur('49.90')]
+    result = reconcile(left, right, tolerance=D('0.05'))
+    assert [(eur('10.00'), eur('9.98'))] == result.matched
+    assert [eur('50')] == result.unmatched_left
+    assert sorted([eur('10.04'), eur('49.90')]) == sorted(
+        result.unmatched_right)
+
+
+def test_reconcile_within_tolerance_skips_taken_entries():
+    left = [eur('1.00'), eur('1.02'), eur('1.03')]
+    right = [eur('1.01'), eur('1.04'), eur('0.98')]
+    result = reconcile(left, right, tolerance=D('0.05'))
+    assert [(eur('1.00'), eur('1.01')), (eur('1.02'), eur('1.04')),
+            (eur('1.03'), eur('0.98'))] == result.matched
+    assert [] == result.unmatched_right
+
+
+def test_reconcile_with_references():
+    left = [(eur('10'), 'A'), (eur('10'), 'B')]
+    right = [(eur('10'), 'B'), (eur('10'), 'C')]
+    result = reconcile(left, right, references=True)
+    assert [((eur('10'), 'B'), (eur('10'), 'B'))] == result.matched
+    assert [(eur('10'), 'A')] == result.unmatched_left
+    assert [(eur('10'), 'C')] == result.unmatched_right
+
+
+def test_reconcile_one_to_many_splits():
+    left = [(eur('100'), 'INV-1'), (eur('5'), 'INV-2'), (eur('7'), 'INV-3')]
+    right = [(eur('60'), 'INV-1'), (eur('40'), 'INV-1'),
+             (eur('2'), 'INV-3'), (eur('3'), 'INV-3')]
+    result = reconcile(left, right)
+    assert [((eur('100'), 'INV-1'),
+             [(eur('60'), 'INV-1'), (eur('40'), 'INV-1')])] == result.partial
+    assert sorted([(eur('5'), 'INV-2'), (eur('7'), 'INV-3')]) == sorted(
+        result.unmatched_left)
+    assert sorted([(eur('2'), 'INV-3'), (eur('3'), 'INV-3')]) == sorted(
+        result.unmatched_right)
+
+
+def test_reconcile_many_to_one_splits():
+    left = [(eur('1.50'), 'X'), (eur('1.50'), 'X')]
+    right = [(eur('3'), 'X')]
+    result = reconcile(left, right)
+    assert [([(eur('1.50'), 'X'), (eur('1.50'), 'X')],
+             (eur('3'), 'X'))] == result.partial
+
+
+def test_reconciler_memory_scales_with_unmatched_entries():
+    reconciler = Reconciler()
+    matches = reconciler.stream((eur(i) for i in range(1000)),
+                                (eur(i) for i in range(1000)))
+    for _ in matches:
+        assert reconciler.pending <= 1
+    assert 0 == reconciler.pending
+
+
+def test_reconcile_with_invalid_entries_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        reconcile([D('10')], [])
+
+
+def test_reconcile_with_invalid_tolerance_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        reconcile([], [], tolerance=0.01)
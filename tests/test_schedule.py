@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_schedule
+----------------------------------
+
+Tests for `pymoney.schedule` module.
+"""
+
+import types
+
+import pytest
+from decimal import Decimal as D
+
+from pymoney import Money, UnsupportedOperatorType
+from pymoney.schedule import (
+    AnnuityTerms, amortize, amortize_batch, compound,
+)
+
+
+def test_amortize_is_lazy():
+    assert isinstance(amortize(Money('1000', 'EUR'), D('0.01'), 12),
+                      types.GeneratorType)
+
+
+def test_amortize_annuity_payment():
+    rows = list(amortize(Money('200000', 'EUR'), D('0.005'), 360))
+    assert 360 == len(rows)
+    assert Money('1199.10', 'EUR') == rows[0].payment
+    assert Money('1000', 'EUR') == rows[0].interest
+    assert Money('199.10', 'EUR') == rows[0].principal
+    assert Money('199800.90', 'EUR') == rows[0].balance
+    assert all(row.payment == rows[0].payment for row in rows[:-1])
+
+
+def test_amortize_last_row_absorbs_residual():
+    principal = Money('200000', 'EUR')
+    rows = list(amortize(principal, D('0.005'), 360))
+    assert Money('0', 'EUR') == rows[-1].balance
+    assert principal == sum(row.principal for row in rows)
+    for row in rows:
+        assert row.payment == row.interest + row.principal
+
+
+def test_amortize_tiny_principal_never_overpays():
+    rows = list(amortize(Money('0.01', 'EUR'), D('0.5'), 3))
+    assert all(row.balance >= Money('0', 'EUR') for row in rows)
+    assert all(row.payment >= Money('0', 'EUR') for row in rows)
+    assert Money('0.01', 'EUR') == sum(row.principal for row in rows)
+    assert Money('0', 'EUR') == rows[-1].balance
+
+
+def test_amortize_without_interest():
+    rows = list(amortize(Money('100', 'EUR'), D('0'), 3))
+    assert [Money('33.33', 'EUR'), Money('33.33', 'EUR'),
+            Money('33.34', 'EUR')] == [row.payment for row in rows]
+
+
+def test_amortize_with_non_decimal_rate_raises():
+    with pytest.raises(UnsupportedOperatorType):
+        list(amortize(Money('100', 'EUR'), 0.01, 3))
+
+
+def test_amortize_without_periods_raises():
+    with pytest.raises(ValueError):
+        list(amortize(Money('100', 'EUR'), D('0.01'), 0))
+
+
+def test_amortize_batch_matches_single_schedules():
+    principals = [Money('1000', 'EUR'), Money('2500.55', 'USD')]
+    batch = [list(rows) for rows in
+             amortize_batch(principals, D('0.004'), 24)]
+    single = [list(amortize(p, D('0.004'), 24)) for p in principals]
+    assert single == batch
+
+
+def test_annuity_terms_payment():
+    terms = AnnuityTerms(D('0.01'), 3)
+    assert Money('340.02', 'EUR') == terms.payment(Money('1000', 'EUR'))
+
+
+def test_compound_rounds_each_row_once():
+    rows = list(compound(Money('100', 'EUR'), D('0.05'), 3))
+    assert [Money('105', 'EUR'), Money('110.25', 'EUR'),
+            Money('115.76', 'EUR')] == [row.balance for row in rows]
+    assert Money('15.76', 'EUR') == sum(row.interest for row in rows)
+
+
+def test_compound_carries_full_precision():
+    rows = list(compound(Money('0.01', 'EUR'), D('0.4'), 4))
+    # Rounding every step would keep the balance at 0.01
+    assert Money('0.04', 'EUR') == rows[-1].balance
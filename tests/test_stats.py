@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_stats
+----------------------------------
+
+Tests for `pymoney.stats` module.
+"""
+
+import array
+import random
+
+import pytest
+from decimal import Decimal as D
+
+from pymoney import Money
+from pymoney import (
+    CurrencyMismatch, InsufficientData, UnsupportedOperatorType,
+)
+from pymoney import stats
+
+
+def test_mean_of_money():
+    values = [Money('10', 'EUR'), Money('20', 'EUR'), Money('40', 'EUR')]
+    assert Money('23.33', 'EUR') == stats.mean(values)
+
+
+def test_mean_of_minor_units():
+    values = array.array('l', [1000, 2000, 4001])
+    assert Money('23.34', 'EUR') == stats.mean(values, currency='EUR')
+
+
+def test_minor_units_without_currency_raise():
+    with pytest.raises(ValueError):
+        stats.mean([100, 200])
+    with pytest.raises(ValueError):
+        stats.percentile([100, 200], 50)
+    with pytest.raises(ValueError):
+        stats.QuantileSketch().update([100, 200]).percentile(50)
+
+
+def test_non_integer_minor_units_raise():
+    for value in (1.9, D('1.5'), '150'):
+        with pytest.raises(UnsupportedOperatorType):
+            stats.mean([100, value], currency='EUR')
+
+
+def test_mean_of_generator_is_single_pass():
+    values = (Money(i, 'EUR') for i in range(1, 101))
+    assert Money('50.50', 'EUR') == stats.mean(values)
+
+
+def test_mean_of_empty_values_raises():
+    with pytest.raises(InsufficientData):
+        stats.mean([], currency='EUR')
+
+
+def test_mean_with_different_currencies_raises():
+    with pytest.raises(CurrencyMismatch):
+        stats.mean([Money('10', 'EUR'), Money('10', 'USD')])
+
+
+def test_variance_is_exact():
+    values = [Money('2', 'EUR'), Money('4', 'EUR'), Money('4', 'EUR'),
+              Money('4', 'EUR'), Money('5', 'EUR'), Money('5', 'EUR'),
+              Money('7', 'EUR'), Money('9', 'EUR')]
+    assert D('4') == stats.variance(values, sample=False)
+    assert D('32') / 7 == stats.variance(values)
+    assert Money('2', 'EUR') == stats.stdev(values, sample=False)
+
+
+def test_sample_variance_of_single_value_raises():
+    with pytest.raises(InsufficientData):
+        stats.variance([Money('1', 'EUR')])
+
+
+def test_running_stats_merge():
+    first = stats.RunningStats().update([Money('1', 'EUR'), Money('2', 'EUR')])
+    second = stats.RunningStats().update([Money('3', 'EUR')])
+    merged = first.merge(second)
+    assert 3 == merged.count
+    assert Money('6', 'EUR') == merged.total()
+    assert Money('2', 'EUR') == merged.mean()
+    assert D('1') == merged.variance()
+
+
+def test_running_stats_merge_with_different_currencies_raises():
+    first = stats.RunningStats('EUR')
+    with pytest.raises(CurrencyMismatch):
+        first.merge(stats.RunningStats('USD'))
+
+
+def test_percentile_exact():
+    values = [Money(i, 'EUR') for i in range(1, 11)]
+    assert Money('1', 'EUR') == stats.percentile(values, 0)
+    assert Money('5.5', 'EUR') == stats.percentile(values, 50)
+    assert Money('10', 'EUR') == stats.percentile(values, 100)
+
+
+def test_percentiles_of_minor_units():
+    result = stats.percentiles([300, 100, 200], [0, 50, 100], currency='USD')
+    assert [Money('1', 'USD'), Money('2', 'USD'), Money('3', 'USD')] == result
+
+
+def test_percentile_out_of_range_raises():
+    with pytest.raises(ValueError):
+        stats.percentile([100], 101, currency='EUR')
+
+
+def test_sketch_percentile_within_relative_accuracy():
+    rng = random.Random(42)
+    data = [rng.randint(-50000, 1000000) for _ in range(10000)]
+    sketch = stats.QuantileSketch('EUR', relative_accuracy=0.01)
+    sketch.update(data)
+    for q in (1, 25, 50, 95, 99):
+        exact = stats.percentile(data, q, currency='EUR').amount
+        estimate = sketch.percentile(q).amount
+        assert abs(estimate - exact) <= abs(exact) * D('0.02') + D('0.01')
+    assert Money(min(data), 'EUR') * D('0.01') == sketch.percentile(0)
+    assert Money(max(data), 'EUR') * D('0.01') == sketch.percentile(100)
+
+
+def test_sketch_merge_equals_single_sketch():
+    values = [Money(i, 'EUR') for i in range(1, 1001)]
+    single = stats.QuantileSketch().update(values)
+    first = stats.QuantileSketch().update(values[:400])
+    second = stats.QuantileSketch().update(values[400:])
+    merged = first.merge(second)
+    assert single.count == merged.count
+    for q in (0, 50, 95, 99, 100):
+        assert single.percentile(q) == merged.percentile(q)
+
+
+def test_sketch_memory_is_bounded():
+    sketch = stats.QuantileSketch('EUR', max_buckets=16)
+    sketch.update(range(1, 100000))
+    assert len(sketch.histogram()) <= 16
+    assert 99999 == sum(count for _, _, count in sketch.histogram())
+    assert Money('999.99', 'EUR') == sketch.percentile(100)
+
+
+def test_sketch_without_values_raises():
+    with pytest.raises(InsufficientData):
+        stats.QuantileSketch('EUR').percentile(50)